@@ -1,11 +1,35 @@
 import os
+import numpy as np
 import pandas as pd
 import json
+import socket
 from datetime import timedelta
-from collections import defaultdict
-from multiprocessing import Pool
+from collections import Counter
+import math
+from multiprocessing import Pool, cpu_count
 import argparse
 
+# Numba is optional: when it is installed risk scores are computed by a compiled kernel,
+# otherwise the same arithmetic runs as NumPy array expressions
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# PyArrow is optional: when it is installed the CSV is parsed by its multithreaded columnar reader,
+# otherwise by pandas. It is also required for the Parquet cache.
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    from pyarrow import csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Blacklists at least this large are kept as packed IPv4 addresses (see pack_ip_blacklist)
+PACKED_BLACKLIST_MIN_SIZE = 10000
+
 # Load configuration from JSON file
 def load_config(config_file='config.json'):
     try:
@@ -26,6 +50,12 @@ def load_config(config_file='config.json'):
             if key not in config:
                 raise KeyError(f"Missing required key '{key}' in config file.")
         
+        # Blacklist lookups happen for every alert, so keep the IPs in a hash set. A large blacklist
+        # keeps only its IPv4 addresses packed, and the set holds just the remaining entries.
+        config['ip_blacklist'] = set(config['ip_blacklist'])
+        if len(config['ip_blacklist']) >= PACKED_BLACKLIST_MIN_SIZE:
+            config['ip_blacklist_packed'], config['ip_blacklist'] = pack_ip_blacklist(config['ip_blacklist'])
+        
         return config
     
     except FileNotFoundError as e:
@@ -44,23 +74,61 @@ def load_config(config_file='config.json'):
 # Precompute alert frequency in the dataset (vectorized approach)
 def precompute_alert_frequency(alert_df, config):
     try:
-        # Convert timestamp to datetime
-        alert_df['timestamp'] = pd.to_datetime(alert_df['timestamp'])
-        
-        # Create a new column, time_window_start, which is the start of the time window for each alert
-        alert_df['time_window_start'] = alert_df['timestamp'] - timedelta(minutes=int(config['frequency_threshold']['time_window'][:-1]))
-        
-        # Keep track of how many alerts have been triggered for each specific combination of target_ip and time_window_start. 
-        # The idea is to count the number of alerts that occurred within the same time window for a specific target IP.
-        frequency_dict = defaultdict(int)
-        for idx, row in alert_df.iterrows():
-            key = (row['target_ip'], row['time_window_start'])
-            frequency_dict[key] += row['alert_count']
-        
-        # Store precomputed frequency in the dataframe
-        alert_df['precomputed_frequency'] = alert_df.apply(
-            lambda row: frequency_dict.get((row['target_ip'], row['time_window_start']), 0), axis=1
-        )
+        # Convert timestamp to datetime. Declaring the ISO 8601 layout keeps parsing on the vectorized
+        # fast path instead of inferring the format per element; repeated timestamps are parsed once.
+        # Timestamps carrying a zone offset are normalized to UTC, as the PyArrow reader does, so
+        # offsets that differ between rows still parse into one datetime column
+        timestamps = alert_df['timestamp']
+        has_offset = pd.api.types.is_string_dtype(timestamps.dtype) and timestamps.str.contains(r'(?:Z|[+-]\d\d:?\d\d)$', na=False).any()
+        alert_df['timestamp'] = pd.to_datetime(timestamps, format='ISO8601', utc=has_offset, cache=True)
+        
+        # Length of the sliding window, e.g. "10m" -> 10 minutes
+        time_window = timedelta(minutes=int(config['frequency_threshold']['time_window'][:-1]))
+        
+        if alert_df.empty:
+            alert_df['precomputed_frequency'] = pd.Series(dtype='int32')
+            return alert_df
+        
+        # Sum alert_count over the alerts seen for the same target IP within the time window ending at each alert.
+        # Alerts sharing a target IP and timestamp are summed first so they all get the same frequency;
+        # sorting once per target IP then lets the rolling window run as a single two-pointer sweep
+        # instead of re-filtering the whole DataFrame for every row.
+        # Grouping on a categorical target_ip keeps the hash-groupby on integer codes.
+        alert_df['target_ip'] = alert_df['target_ip'].astype('category')
+        
+        # A blank alert_count adds nothing to the window; without an alert_count column every alert counts once
+        if 'alert_count' in alert_df.columns:
+            alert_counts = alert_df['alert_count'].fillna(0).to_numpy(dtype=np.float64)
+        else:
+            alert_counts = np.ones(len(alert_df))
+        
+        # Alerts without a timestamp fall in no window and only count themselves
+        frequencies = alert_counts.copy()
+        
+        # Group on the target IP category codes: a blank target IP has code -1 and forms its own group
+        # instead of being dropped by the groupby
+        has_time = alert_df['timestamp'].notna().to_numpy()
+        timed = pd.DataFrame({
+            'target_code': alert_df['target_ip'].cat.codes.to_numpy()[has_time],
+            'timestamp': alert_df['timestamp'].array[has_time],
+            'alert_count': alert_counts[has_time]
+        })
+        per_time = timed.groupby(['target_code', 'timestamp'], sort=True)['alert_count'].sum()
+        per_time = per_time.rename('alert_total').reset_index()
+        
+        if len(per_time):
+            # per_time is sorted by target IP then timestamp, which is also the order of the rolling output
+            per_time['precomputed_frequency'] = per_time.groupby('target_code', sort=False).rolling(
+                time_window, on='timestamp'
+            )['alert_total'].sum().to_numpy()
+            
+            # Map the windowed totals back onto the alerts in their original row order
+            frequencies[has_time] = timed[['target_code', 'timestamp']].merge(
+                per_time[['target_code', 'timestamp', 'precomputed_frequency']],
+                on=['target_code', 'timestamp'], how='left'
+            )['precomputed_frequency'].to_numpy()
+        
+        alert_df['precomputed_frequency'] = frequencies.astype('int32')
         return alert_df
     except KeyError as e:
         print(f"Error: Missing expected column in input CSV - {e}")
@@ -69,6 +137,12 @@ def precompute_alert_frequency(alert_df, config):
         print(f"Error while precomputing alert frequencies: {e}")
         exit(1)
 
+# Check a single IP against the blacklist, packed or not
+def _is_blacklisted(ip, config):
+    if 'ip_blacklist_packed' in config:
+        return bool(_packed_blacklist_isin([ip], config['ip_blacklist_packed'], config['ip_blacklist'])[0])
+    return ip in config['ip_blacklist']
+
 # Calculate risk score for an alert (optimized with vectorized operations)
 def calculate_risk_score(alert, config):
     try:
@@ -79,7 +153,7 @@ def calculate_risk_score(alert, config):
         severity_weight = alert['severity'] * config['severity_weight']
         
         # Check if the source IP is blacklisted
-        blacklist_weight = 10 if alert['source_ip'] in config['ip_blacklist'] else 0
+        blacklist_weight = 10 if _is_blacklisted(alert['source_ip'], config) else 0
         
         # Check frequency (precomputed)
         frequency_weight = 1 if alert['precomputed_frequency'] >= config['frequency_threshold']['count'] else 0
@@ -107,65 +181,342 @@ def classify_priority(risk_score):
     else:
         return 'Low'
 
-# Function to process a chunk of data and return results (parallelized)
-def process_chunk(chunk, config):
+# Priority labels indexed by the priority codes emitted by the scoring kernel
+PRIORITY_LABELS = np.array(['Low', 'Medium', 'High'], dtype=object)
+
+# Risk score thresholds between the priority codes: a score above 8 is Medium, above 15 is High
+PRIORITY_THRESHOLDS = np.array([8.0, 15.0])
+
+# Priority codes for an array of risk scores: the number of thresholds each score exceeds,
+# found by a branchless binary search over the thresholds. searchsorted sorts NaN after every
+# threshold, so a missing score is set back to Low to match classify_priority.
+def _priority_codes(risk_scores):
+    risk_scores = np.asarray(risk_scores, dtype=np.float64)
+    priority_codes = np.searchsorted(PRIORITY_THRESHOLDS, risk_scores, side='left').astype(np.int8)
+    priority_codes[np.isnan(risk_scores)] = 0
+    return priority_codes
+
+# Scoring kernel over column arrays, returning risk scores and priority codes (0=Low, 1=Medium, 2=High).
+# Category codes index into the weight lookup tables; a missing value has code -1, which selects
+# the trailing 0 weight of each table.
+def _score_numpy(severity, frequency_ok, alert_type_codes, user_role_codes, blacklisted,
+                 alert_type_lut, role_lut, severity_weight):
+    risk_scores = (alert_type_lut[alert_type_codes] + severity * severity_weight + blacklisted * 10.0
+                   + frequency_ok + role_lut[user_role_codes])
+    return risk_scores, _priority_codes(risk_scores)
+
+if NUMBA_AVAILABLE:
+    # Scores and classifies each alert in one serial pass (the worker pool supplies the parallelism).
+    # fastmath stays off so scores match calculate_risk_score; the signature compiles it at import.
+    @njit('Tuple((f8[:], i1[:]))(f8[:], i1[:], i4[:], i4[:], b1[:], f8[:], f8[:], f8)', cache=True)
+    def _score_numba(severity, frequency_ok, alert_type_codes, user_role_codes, blacklisted,
+                     alert_type_lut, role_lut, severity_weight):
+        risk_scores = np.empty(severity.size, dtype=np.float64)
+        priority_codes = np.empty(severity.size, dtype=np.int8)
+        for i in range(severity.size):
+            risk_score = (alert_type_lut[alert_type_codes[i]] + severity[i] * severity_weight
+                          + (10.0 if blacklisted[i] else 0.0) + frequency_ok[i]
+                          + role_lut[user_role_codes[i]])
+            risk_scores[i] = risk_score
+            priority_codes[i] = 2 if risk_score > 15 else (1 if risk_score > 8 else 0)
+        return risk_scores, priority_codes
+
+    score_kernel = _score_numba
+else:
+    score_kernel = _score_numpy
+
+# Encode a string column as category codes plus a weight lookup table aligned with the categories.
+# Columns read by read_alerts are already categorical, so this is a gather over their existing codes.
+def _category_weights(column, weights):
+    if not isinstance(column.dtype, pd.CategoricalDtype):
+        column = column.astype('category')
+    lut = np.array([weights.get(category, 0) for category in column.cat.categories] + [0], dtype=np.float64)
+    return column.cat.codes.to_numpy(dtype=np.int32), lut
+
+# Membership mask for a string column: each distinct value is checked once with is_member, then the
+# mask is gathered through the category codes (a missing value selects the trailing False)
+def _category_mask(column, is_member):
+    if not isinstance(column.dtype, pd.CategoricalDtype):
+        column = column.astype('category')
+    mask = np.append(is_member(column.cat.categories), False)
+    return mask[column.cat.codes.to_numpy()]
+
+# Parse dotted-quad IPv4 strings into uint32 values. Returns the packed values and a mask of which
+# strings were valid IPv4 addresses (invalid ones pack to 0).
+def _ipv4_to_uint32(ips):
+    packed = np.zeros(len(ips), dtype=np.uint32)
+    valid = np.zeros(len(ips), dtype=np.bool_)
+    for i, ip in enumerate(ips):
+        try:
+            packed[i] = int.from_bytes(socket.inet_pton(socket.AF_INET, ip), 'big')
+            valid[i] = True
+        except (OSError, TypeError):
+            pass
+    return packed, valid
+
+# Pack a large IP blacklist into a sorted uint32 array, so membership is a binary search over
+# 4 bytes per entry instead of hashing every source IP string against a set of strings.
+# Entries that are not IPv4 addresses are kept aside in a set.
+def pack_ip_blacklist(ip_blacklist):
+    ips = list(ip_blacklist)
+    packed, valid = _ipv4_to_uint32(ips)
+    other_ips = {ip for ip, is_ipv4 in zip(ips, valid) if not is_ipv4}
+    return np.unique(packed[valid]), other_ips
+
+# Check which IP strings are in a blacklist packed by pack_ip_blacklist
+def _packed_blacklist_isin(ips, sorted_ips, other_ips):
+    packed, valid = _ipv4_to_uint32(ips)
+    found = np.zeros(len(packed), dtype=np.bool_)
+    if len(sorted_ips):
+        positions = np.minimum(np.searchsorted(sorted_ips, packed), len(sorted_ips) - 1)
+        found = valid & (sorted_ips[positions] == packed)
+    if other_ips:
+        found |= ~valid & pd.Index(ips).isin(other_ips)
+    return found
+
+# Score and classify every alert in a DataFrame at once (column-wise equivalent of
+# calculate_risk_score + classify_priority). Returns the risk scores and priority labels.
+def score_alerts(alert_df, config):
+    try:
+        # Alert type and target role weights as lookup tables over category codes
+        alert_type_codes, alert_type_lut = _category_weights(alert_df['alert_type'], config['alert_type_weights'])
+        user_role_codes, role_lut = _category_weights(alert_df['user_role'], config['role_weights'])
+        
+        # Severity stays float64 so scores match calculate_risk_score digit for digit; the other
+        # kernel inputs are narrowed (int32 category codes, int8 frequency flag)
+        severity = alert_df['severity'].to_numpy(dtype=np.float64)
+        
+        # Check if the source IP is blacklisted
+        if 'ip_blacklist_packed' in config:
+            blacklisted = _category_mask(
+                alert_df['source_ip'], lambda ips: _packed_blacklist_isin(ips, config['ip_blacklist_packed'], config['ip_blacklist'])
+            )
+        else:
+            blacklisted = _category_mask(alert_df['source_ip'], lambda ips: ips.isin(config['ip_blacklist']))
+        
+        # Check frequency (precomputed)
+        frequency_ok = (alert_df['precomputed_frequency'].to_numpy() >= config['frequency_threshold']['count']).astype(np.int8)
+        
+        # Calculate the total risk score and its priority in one pass
+        risk_scores, priority_codes = score_kernel(
+            severity, frequency_ok, alert_type_codes, user_role_codes, blacklisted,
+            alert_type_lut, role_lut, np.float64(config['severity_weight'])
+        )
+        return risk_scores, PRIORITY_LABELS[priority_codes]
+    # Errors are raised rather than exiting: score_alerts runs inside the worker processes, where
+    # exit() would kill the worker and leave the pool waiting forever for its chunk
+    except KeyError as e:
+        print(f"Error: Missing expected column in alert data - {e}")
+        raise
+    except Exception as e:
+        print(f"Unexpected error while calculating risk scores: {e}")
+        raise
+
+# Columns read by score_alerts, plus the alert_id carried into the results
+SCORING_COLUMNS = ['alert_id', 'alert_type', 'severity', 'source_ip', 'user_role']
+
+# Columns of the prioritized alerts output
+RESULT_COLUMNS = ['alert_id', 'risk_score', 'priority']
+
+# Function to process a chunk of data and return the results as a DataFrame (parallelized)
+def score_chunk(chunk, config):
     try:
-        results = []
-        alert_df = precompute_alert_frequency(chunk, config)
-        for _, alert in alert_df.iterrows():
-            risk_score = calculate_risk_score(alert, config)
-            priority = classify_priority(risk_score)
-            results.append({'alert_id': alert['alert_id'], 'risk_score': risk_score, 'priority': priority})
-        return results
+        # Frequencies computed over the whole input by process_alerts are kept as they are
+        if 'precomputed_frequency' in chunk.columns:
+            alert_df = chunk
+        else:
+            alert_df = precompute_alert_frequency(chunk, config)
+        risk_scores, priorities = score_alerts(alert_df, config)
+        return pd.DataFrame({
+            'alert_id': alert_df['alert_id'].to_numpy(),
+            'risk_score': risk_scores,
+            'priority': priorities
+        })
     
     except Exception as e:
         print(f"Error processing chunk: {e}")
-        return []
+        return pd.DataFrame(columns=RESULT_COLUMNS)
+
+# Function to process a chunk of data and return results as a list of records
+def process_chunk(chunk, config):
+    return score_chunk(chunk, config).to_dict('records')
+
+# Config shared by the worker processes. It is sent once per worker through the pool initializer
+# instead of being pickled along with every chunk.
+_worker_config = None
+
+def _init_worker(config):
+    global _worker_config
+    _worker_config = config
+    _warm_up_kernel()
+
+# Run the scoring kernel once on a single dummy alert so its compiled code is loaded and ready
+# before the worker takes its first chunk
+def _warm_up_kernel():
+    score_kernel(
+        np.zeros(1, dtype=np.float64), np.zeros(1, dtype=np.int8),
+        np.zeros(1, dtype=np.int32), np.zeros(1, dtype=np.int32), np.zeros(1, dtype=np.bool_),
+        np.zeros(1, dtype=np.float64), np.zeros(1, dtype=np.float64), np.float64(0)
+    )
+
+def _score_chunk_worker(chunk):
+    return score_chunk(chunk, _worker_config)
+
+# Column dtypes declared up front so the parser never builds object columns for repeated strings.
+# Categorical columns hold small integer codes plus one copy of each distinct string.
+ALERT_DTYPES = {
+    'source_ip': 'category',
+    'target_ip': 'category',
+    'user_role': 'category',
+    'alert_type': 'category',
+    'severity': 'float64',
+    'alert_count': 'Int32'  # nullable, so a blank count does not abort the parse
+}
+
+# Columns used by the prioritization; a cached Parquet file is read back with only these
+ALERT_COLUMNS = ['alert_id', 'alert_type', 'severity', 'source_ip', 'target_ip', 'timestamp', 'alert_count', 'user_role']
+
+# Parse the alerts CSV into a DataFrame. The file is memory-mapped so the parser reads straight
+# from the OS page cache instead of through an intermediate buffered copy.
+def _read_alerts_csv(dataFile):
+    if PYARROW_AVAILABLE:
+        # Parse with PyArrow's multithreaded reader straight into columnar buffers; string columns
+        # arrive dictionary-encoded and convert to pandas categoricals without re-hashing
+        with pa.memory_map(dataFile, 'r') as source:
+            table = pacsv.read_csv(
+                source,
+                read_options=pacsv.ReadOptions(block_size=64 << 20),
+                convert_options=pacsv.ConvertOptions(column_types={
+                    'severity': pa.float64(),
+                    'alert_count': pa.int32()
+                })
+            )
+        return table.to_pandas(strings_to_categorical=True)
+    return pd.read_csv(dataFile, memory_map=True, engine='c', encoding='utf-8', dtype=ALERT_DTYPES)
 
-# Function to read CSV in chunks, process and store results
-def process_alerts(dataFile, configFile):
+# Read the alerts into a DataFrame. With cache=True the parsed alerts are kept in a Parquet file
+# next to the CSV (<dataFile>.parquet) and later runs read that instead of re-parsing the CSV,
+# as long as it is newer than the CSV.
+def read_alerts(dataFile, cache=False):
+    if cache and not PYARROW_AVAILABLE:
+        print("Warning: pyarrow is not installed, the Parquet cache is disabled.")
+        cache = False
+    
+    cache_file = dataFile + '.parquet'
+    if cache and os.path.exists(cache_file) and os.path.getmtime(cache_file) >= os.path.getmtime(dataFile):
+        cached_columns = pq.read_schema(cache_file).names
+        return pd.read_parquet(
+            cache_file, engine='pyarrow',
+            columns=[column for column in ALERT_COLUMNS if column in cached_columns]
+        )
+    
+    alert_df = _read_alerts_csv(dataFile)
+    if cache:
+        alert_df.to_parquet(cache_file, engine='pyarrow', compression='snappy', index=False)
+    return alert_df
+
+# Split a DataFrame into chunks of at most chunk_size rows. A sliced categorical column keeps every
+# category of the whole input, so each chunk drops the categories it does not use; otherwise every
+# chunk sent to a worker would pickle the full set of distinct IPs along with its rows.
+def iter_chunks(alert_df, chunk_size):
+    categorical_columns = [column for column in alert_df.columns
+                           if isinstance(alert_df[column].dtype, pd.CategoricalDtype)]
+    for start in range(0, len(alert_df), chunk_size):
+        chunk = alert_df.iloc[start:start + chunk_size].copy()
+        for column in categorical_columns:
+            chunk[column] = chunk[column].cat.remove_unused_categories()
+        yield chunk
+
+# Score the alerts chunk by chunk, yielding each chunk's results DataFrame as soon as it is ready
+def iter_results(alert_df, config, chunk_size, processes=None):
+    if len(alert_df) <= chunk_size:
+        # A single chunk is processed in-process; starting worker processes would cost more than the work itself
+        yield score_chunk(alert_df, config)
+        return
+    
+    # Never start more workers than there are chunks to process
+    num_chunks = math.ceil(len(alert_df) / chunk_size)
+    if processes is None:
+        processes = min(cpu_count(), num_chunks)
+    
+    # Send chunks to the workers in batches so the per-task pickling and pipe round trip is paid
+    # once per batch; about four batches per worker still leaves room to balance uneven chunks
+    batch_size = max(1, math.ceil(num_chunks / (processes * 4)))
+    
+    # Chunks are dispatched asynchronously and collected as soon as any worker finishes one,
+    # so results are not necessarily in input order
+    with Pool(processes=processes, initializer=_init_worker, initargs=(config,)) as pool:
+        yield from pool.imap_unordered(_score_chunk_worker, iter_chunks(alert_df, chunk_size), chunksize=batch_size)
+
+# Function to read CSV, process it in chunks and store results
+def process_alerts(dataFile, configFile, processes=None, cache=False):
     try:
+        if processes is not None and processes < 1:
+            raise ValueError(f"The number of processes must be a positive integer, got {processes}.")
+        
         # Load config and initialize variables
         config = load_config(configFile)
         chunk_size = 10000  # Adjust based on memory limitations and dataset size
-        results = []
+        priority_counts = Counter()
+        
+        # Read CSV (or its Parquet cache)
+        alert_df = read_alerts(dataFile, cache=cache)
+        
+        # Compute frequencies once over the whole input rather than per chunk: one global sort replaces
+        # a sort per chunk, and time windows that straddle a chunk boundary are counted in full
+        alert_df = precompute_alert_frequency(alert_df, config)
         
-        # Read CSV in chunks
-        # Set up multiprocessing pool for parallel processing
-        with Pool() as pool:
-            chunks = pd.read_csv(dataFile, chunksize=chunk_size)
-            for chunk in chunks:
-                result = pool.apply(process_chunk, (chunk, config))
-                results.extend(result)
+        # Check the scoring columns here, before any worker is started, so a bad input is reported once
+        missing_columns = [column for column in SCORING_COLUMNS if column not in alert_df.columns]
+        if missing_columns:
+            raise KeyError(', '.join(missing_columns))
         
-        # Convert results to DataFrame and save to CSV
-        results_df = pd.DataFrame(results)
-        results_df.to_csv('alerts_with_priority.csv', index=False)
+        # Append each chunk's results to the output CSV as it arrives instead of collecting all of them
+        # first, so only one chunk of results is held in memory at a time
+        with open('alerts_with_priority.csv', 'w', newline='') as output_file:
+            pd.DataFrame(columns=RESULT_COLUMNS).to_csv(output_file, index=False)
+            for results_df in iter_results(alert_df, config, chunk_size, processes):
+                results_df.to_csv(output_file, header=False, index=False)
+                priority_counts.update(results_df['priority'].value_counts().to_dict())
         
         # Return summary of priorities
-        priority_summary = results_df['priority'].value_counts()
-        return priority_summary
+        priority_summary = pd.Series(priority_counts, name='count', dtype='int64').rename_axis('priority')
+        return priority_summary.sort_values(ascending=False)
     except FileNotFoundError as e:
         print(f"Error: {e}")
         exit(1)
+    except KeyError as e:
+        print(f"Error: Missing expected column in input CSV - {e}")
+        exit(1)
     except ValueError as e:
         print(f"Error: {e}")
         exit(1)
     except pd.errors.ParserError:
-        print(f"Error: The input CSV file '{input_file}' could not be parsed. Ensure it's correctly formatted.")
+        print(f"Error: The input CSV file '{dataFile}' could not be parsed. Ensure it's correctly formatted.")
         exit(1)
     except Exception as e:
         print(f"Unexpected error while processing alerts: {e}")
         exit(1)
 
+# argparse type for options that take a positive integer
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
 if __name__ == "__main__":
     # Parse arguments
     parser = argparse.ArgumentParser(prog='Scalable Alert Prioritization')
     parser.add_argument("dataFile", help="The CSV file with alerts to parse.")
     parser.add_argument("configFile", help="The risk scoring JSON config file.")
+    parser.add_argument("--processes", type=positive_int, default=None,
+                        help="Number of worker processes. Defaults to the number of CPUs, capped at the number of chunks.")
+    parser.add_argument("--cache", action="store_true",
+                        help="Cache the parsed alerts in <dataFile>.parquet and reuse it on later runs.")
     args = parser.parse_args()
 
     # Process alerts
-    priority_summary = process_alerts(args.dataFile, args.configFile)
+    priority_summary = process_alerts(args.dataFile, args.configFile, processes=args.processes, cache=args.cache)
     print("Priority Summary:")
     print(priority_summary)
@@ -1,13 +1,26 @@
 import unittest
+import numpy as np
 import pandas as pd
 import os
+import json
+import shutil
+import tempfile
 from datetime import datetime, timedelta
 from alert_prioritization import (
     load_config,
     classify_priority,
     precompute_alert_frequency,
     calculate_risk_score,
-    process_chunk
+    score_alerts,
+    score_kernel,
+    _score_numpy,
+    pack_ip_blacklist,
+    process_chunk,
+    score_chunk,
+    read_alerts,
+    iter_chunks,
+    iter_results,
+    process_alerts
 )
 
 class TestAlertPrioritization(unittest.TestCase):
@@ -55,12 +68,94 @@ class TestAlertPrioritization(unittest.TestCase):
         with self.assertRaises(FileNotFoundError):
             load_config('invalid_config.json')
 
+    def test_load_config_blacklist_set(self):
+        """Test that the IP blacklist is loaded as a set."""
+        config_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config.json")
+        config = load_config(config_file)
+        self.assertIsInstance(config["ip_blacklist"], set)
+        self.assertIn("192.168.1.100", config["ip_blacklist"])
+
+    def test_load_config_large_blacklist_packed(self):
+        """Test that a large blacklist is packed and still matches alerts."""
+        config = dict(self.config, ip_blacklist=[f"10.0.{i // 256}.{i % 256}" for i in range(20000)] + ["::1"])
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config_file = os.path.join(tmp_dir, "config.json")
+            with open(config_file, "w") as file:
+                json.dump(config, file)
+            config = load_config(config_file)
+        self.assertEqual(config["ip_blacklist"], {"::1"})
+        self.assertEqual(len(config["ip_blacklist_packed"]), 20000)
+        alert = self.alert_data.iloc[0].to_dict()
+        alert["precomputed_frequency"] = 0
+        base_score = calculate_risk_score(alert, config)
+        alert["source_ip"] = "10.0.3.7"
+        self.assertAlmostEqual(calculate_risk_score(alert, config) - base_score, 10)
+
     def test_precompute_alert_frequency(self):
         """Test precomputing alert frequency in the dataset."""
         alert_df = precompute_alert_frequency(self.alert_data.copy(), self.config)
         self.assertIn("precomputed_frequency", alert_df.columns)
         self.assertGreaterEqual(alert_df["precomputed_frequency"].iloc[0], 0)
 
+    def test_precompute_alert_frequency_time_window(self):
+        """Test that frequency sums alerts for the same target IP within the time window."""
+        alert_df = self.alert_data.copy()
+        alert_df["target_ip"] = ["192.168.1.1", "192.168.1.1", "192.168.1.1"]
+        alert_df["timestamp"] = ["2024-12-16T09:00:00", "2024-12-16T09:05:00", "2024-12-16T09:30:00"]
+        alert_df = precompute_alert_frequency(alert_df, self.config)
+        self.assertEqual(alert_df["precomputed_frequency"].tolist(), [7, 17, 3])
+
+    def test_precompute_alert_frequency_duplicate_timestamps(self):
+        """Test that alerts for the same target IP and timestamp get the same frequency."""
+        alert_df = self.alert_data.copy()
+        alert_df["target_ip"] = ["192.168.1.1", "192.168.1.1", "192.168.1.1"]
+        alert_df["timestamp"] = ["2024-12-16T09:00:00", "2024-12-16T09:00:00", "2024-12-16T09:01:00"]
+        alert_df["alert_count"] = [3, 3, 1]
+        alert_df = precompute_alert_frequency(alert_df, self.config)
+        self.assertEqual(alert_df["precomputed_frequency"].tolist(), [6, 6, 7])
+
+    def test_precompute_alert_frequency_blank_target_ip(self):
+        """Test that alerts with a blank target IP are grouped together instead of failing."""
+        alert_df = self.alert_data.copy()
+        alert_df["target_ip"] = [None, None, "192.168.1.3"]
+        alert_df["timestamp"] = ["2024-12-16T09:00:00", "2024-12-16T09:05:00", "2024-12-16T09:05:00"]
+        alert_df = precompute_alert_frequency(alert_df, self.config)
+        self.assertEqual(alert_df["precomputed_frequency"].tolist(), [7, 17, 3])
+
+    def test_precompute_alert_frequency_blank_timestamp(self):
+        """Test that an alert without a timestamp only counts itself."""
+        alert_df = self.alert_data.copy()
+        alert_df["target_ip"] = ["192.168.1.1", "192.168.1.1", "192.168.1.1"]
+        alert_df["timestamp"] = ["2024-12-16T09:00:00", None, "2024-12-16T09:05:00"]
+        alert_df = precompute_alert_frequency(alert_df, self.config)
+        self.assertEqual(alert_df["precomputed_frequency"].tolist(), [7, 10, 10])
+
+    def test_precompute_alert_frequency_blank_alert_count(self):
+        """Test that a blank alert_count adds nothing to the window."""
+        alert_df = self.alert_data.copy()
+        alert_df["target_ip"] = ["192.168.1.1", "192.168.1.1", "192.168.1.1"]
+        alert_df["timestamp"] = ["2024-12-16T09:00:00", "2024-12-16T09:05:00", "2024-12-16T09:06:00"]
+        alert_df["alert_count"] = [7, None, 3]
+        alert_df = precompute_alert_frequency(alert_df, self.config)
+        self.assertEqual(alert_df["precomputed_frequency"].tolist(), [7, 7, 10])
+
+    def test_precompute_alert_frequency_without_alert_count(self):
+        """Test that frequency counts alerts when there is no alert_count column."""
+        alert_df = self.alert_data.drop(columns=["alert_count"])
+        alert_df["target_ip"] = ["192.168.1.1", "192.168.1.1", "192.168.1.1"]
+        alert_df["timestamp"] = ["2024-12-16T09:00:00", "2024-12-16T09:05:00", "2024-12-16T09:30:00"]
+        alert_df = precompute_alert_frequency(alert_df, self.config)
+        self.assertEqual(alert_df["precomputed_frequency"].tolist(), [1, 2, 1])
+
+    def test_precompute_alert_frequency_without_alert_count_blank_alert_id(self):
+        """Test that counting alerts does not depend on alert_id being filled in."""
+        alert_df = self.alert_data.drop(columns=["alert_count"])
+        alert_df["alert_id"] = [1, None, 3]
+        alert_df["target_ip"] = ["192.168.1.1", "192.168.1.1", "192.168.1.1"]
+        alert_df["timestamp"] = ["2024-12-16T09:00:00", "2024-12-16T09:05:00", "2024-12-16T09:30:00"]
+        alert_df = precompute_alert_frequency(alert_df, self.config)
+        self.assertEqual(alert_df["precomputed_frequency"].tolist(), [1, 2, 1])
+
     def test_precompute_alert_frequency_empty(self):
         """Test precomputing alert frequency with an empty DataFrame."""
         empty_df = pd.DataFrame(columns=self.alert_data.columns)
@@ -90,6 +185,31 @@ class TestAlertPrioritization(unittest.TestCase):
         risk_score = calculate_risk_score(alert, self.config)
         self.assertGreater(risk_score, 0)
 
+    def test_score_alerts_risk_scores(self):
+        """Test that vectorized risk scores match the per-alert calculation."""
+        alert_df = self.alert_data.copy()
+        alert_df["precomputed_frequency"] = [3, 5, 2]
+        risk_scores, _ = score_alerts(alert_df, self.config)
+        for i, (_, alert) in enumerate(alert_df.iterrows()):
+            self.assertAlmostEqual(risk_scores[i], calculate_risk_score(alert.to_dict(), self.config), places=5)
+
+    def test_score_alerts(self):
+        """Test that fused scoring returns priorities consistent with classify_priority."""
+        alert_df = self.alert_data.copy()
+        alert_df["precomputed_frequency"] = [3, 5, 2]
+        risk_scores, priorities = score_alerts(alert_df, self.config)
+        self.assertEqual(list(priorities), [classify_priority(score) for score in risk_scores])
+
+    def test_score_alerts_packed_blacklist(self):
+        """Test that a packed IP blacklist scores the same as the plain set."""
+        alert_df = self.alert_data.copy()
+        alert_df["precomputed_frequency"] = [3, 5, 2]
+        packed_ips, other_ips = pack_ip_blacklist(self.config["ip_blacklist"])
+        packed_config = dict(self.config, ip_blacklist_packed=packed_ips, ip_blacklist=other_ips)
+        expected, _ = score_alerts(alert_df, self.config)
+        risk_scores, _ = score_alerts(alert_df, packed_config)
+        self.assertEqual(list(risk_scores), list(expected))
+
     def test_process_chunk(self):
         """Test processing a chunk of alert data."""
         chunk = self.alert_data.copy()
@@ -101,6 +221,123 @@ class TestAlertPrioritization(unittest.TestCase):
             self.assertIn("risk_score", result)
             self.assertIn("priority", result)
 
+    def test_score_chunk(self):
+        """Test that scoring a chunk returns one result row per alert."""
+        results_df = score_chunk(self.alert_data.copy(), self.config)
+        self.assertEqual(list(results_df.columns), ["alert_id", "risk_score", "priority"])
+        self.assertEqual(results_df["alert_id"].tolist(), [1, 2, 3])
+
+    def test_score_chunk_keeps_precomputed_frequency(self):
+        """Test that scoring a chunk uses frequencies already computed for the whole input."""
+        chunk = self.alert_data.copy()
+        chunk["precomputed_frequency"] = [0, 0, 0]
+        results_df = score_chunk(chunk, self.config)
+        alert = chunk.iloc[0].to_dict()
+        self.assertAlmostEqual(results_df["risk_score"].iloc[0], calculate_risk_score(alert, self.config), places=5)
+
+    def test_score_chunk_fractional_severity(self):
+        """Test that a fractional severity scores exactly as calculate_risk_score does."""
+        chunk = self.alert_data.copy()
+        chunk["severity"] = [2.7, 3.3, 0.1]
+        chunk["precomputed_frequency"] = [3, 5, 2]
+        results_df = score_chunk(chunk, self.config)
+        expected = [calculate_risk_score(alert.to_dict(), self.config) for _, alert in chunk.iterrows()]
+        self.assertEqual(results_df["risk_score"].tolist(), expected)
+
+    def test_iter_results_worker_pool(self):
+        """Test that scoring chunks in worker processes matches scoring the whole frame."""
+        alert_df = pd.concat([self.alert_data] * 3, ignore_index=True)
+        alert_df["alert_id"] = range(1, len(alert_df) + 1)
+        alert_df["source_ip"] = alert_df["source_ip"].astype("category")
+        alert_df = precompute_alert_frequency(alert_df, self.config)
+        expected = score_chunk(alert_df.copy(), self.config)
+        results_df = pd.concat(list(iter_results(alert_df, self.config, chunk_size=2, processes=2)))
+        results_df = results_df.sort_values("alert_id").reset_index(drop=True)
+        pd.testing.assert_frame_equal(results_df, expected)
+
+    def test_score_alerts_missing_column(self):
+        """Test that a missing column raises instead of exiting, so worker processes survive it."""
+        with self.assertRaises(KeyError):
+            score_alerts(self.alert_data.drop(columns=["user_role"]).assign(precomputed_frequency=0), self.config)
+
+    def test_iter_results_worker_pool_missing_column(self):
+        """Test that a chunk failing in a worker process returns no results instead of hanging the pool."""
+        alert_df = pd.concat([self.alert_data] * 3, ignore_index=True).drop(columns=["user_role"])
+        alert_df = precompute_alert_frequency(alert_df, self.config)
+        results_df = pd.concat(list(iter_results(alert_df, self.config, chunk_size=2, processes=2)))
+        self.assertTrue(results_df.empty)
+
+    def test_process_alerts_missing_column(self):
+        """Test that a missing scoring column is reported before any chunk is scored."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_file = os.path.join(tmp_dir, "alerts.csv")
+            self.alert_data.drop(columns=["user_role"]).to_csv(tmp_file, index=False)
+            config_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config.json")
+            with self.assertRaises(SystemExit):
+                process_alerts(tmp_file, config_file)
+
+    def test_process_alerts_invalid_processes(self):
+        """Test that a non-positive number of processes is rejected."""
+        with self.assertRaises(SystemExit):
+            process_alerts("data.csv", "config.json", processes=0)
+
+    def test_read_alerts(self):
+        """Test reading the sample alerts CSV and splitting it into chunks."""
+        data_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data.csv")
+        alert_df = read_alerts(data_file)
+        self.assertEqual(len(alert_df), 10)
+        self.assertIn("alert_count", alert_df.columns)
+        chunks = list(iter_chunks(alert_df, 4))
+        self.assertEqual([len(chunk) for chunk in chunks], [4, 4, 2])
+
+    def test_iter_chunks_drops_unused_categories(self):
+        """Test that each chunk's categorical columns keep only the categories used in that chunk."""
+        alert_df = self.alert_data.copy()
+        alert_df["source_ip"] = alert_df["source_ip"].astype("category")
+        for chunk in iter_chunks(alert_df, 2):
+            self.assertEqual(set(chunk["source_ip"].cat.categories), set(chunk["source_ip"]))
+
+    def test_read_alerts_cache(self):
+        """Test that a cached read returns the same alerts as the CSV."""
+        data_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data.csv")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_file = os.path.join(tmp_dir, "data.csv")
+            shutil.copy(data_file, tmp_file)
+            first = read_alerts(tmp_file, cache=True)
+            second = read_alerts(tmp_file, cache=True)
+        self.assertEqual(first["alert_id"].tolist(), second["alert_id"].tolist())
+        self.assertEqual(first["source_ip"].astype(str).tolist(), second["source_ip"].astype(str).tolist())
+
+    def test_read_alerts_timestamp_offset(self):
+        """Test that timestamps with a zone offset are read and windowed."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_file = os.path.join(tmp_dir, "alerts.csv")
+            self.alert_data.assign(
+                target_ip="192.168.1.1",
+                timestamp=["2024-12-16T09:00:00Z", "2024-12-16T09:05:00Z", "2024-12-16T09:30:00Z"]
+            ).to_csv(tmp_file, index=False)
+            alert_df = precompute_alert_frequency(read_alerts(tmp_file), self.config)
+        self.assertEqual(alert_df["precomputed_frequency"].tolist(), [7, 17, 3])
+
+    def test_read_alerts_mixed_timestamp_offsets(self):
+        """Test that timestamps with different zone offsets are read and compared in UTC."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_file = os.path.join(tmp_dir, "alerts.csv")
+            self.alert_data.assign(
+                target_ip="192.168.1.1",
+                timestamp=["2024-12-16T09:00:00Z", "2024-12-16T11:05:00+02:00", "2024-12-16T09:30:00Z"]
+            ).to_csv(tmp_file, index=False)
+            alert_df = precompute_alert_frequency(read_alerts(tmp_file), self.config)
+        self.assertEqual(alert_df["precomputed_frequency"].tolist(), [7, 17, 3])
+
+    def test_read_alerts_blank_alert_count(self):
+        """Test that a blank alert_count cell is read and scored."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_file = os.path.join(tmp_dir, "alerts.csv")
+            self.alert_data.assign(alert_count=pd.array([7, None, 3], dtype="Int64")).to_csv(tmp_file, index=False)
+            results_df = score_chunk(read_alerts(tmp_file), self.config)
+        self.assertEqual(results_df["alert_id"].tolist(), [1, 2, 3])
+
     def test_classify_priority(self):
         """Test classifying priority based on risk score."""
         self.assertEqual(classify_priority(9), "Medium")
@@ -112,6 +349,21 @@ class TestAlertPrioritization(unittest.TestCase):
         self.assertEqual(classify_priority(15), "Medium")
         self.assertEqual(classify_priority(8), "Low")
 
+    def test_score_kernels_agree(self):
+        """Test that the NumPy and active scoring kernels give the same scores and priorities, including boundaries."""
+        severity = np.array([3, 8, 9, 15, 17, np.nan], dtype=np.float64)
+        kernel_args = (
+            severity, np.zeros(len(severity), dtype=np.int8),
+            np.zeros(len(severity), dtype=np.int32), np.zeros(len(severity), dtype=np.int32),
+            np.zeros(len(severity), dtype=np.bool_),
+            np.zeros(1, dtype=np.float64), np.zeros(1, dtype=np.float64), np.float64(1)
+        )
+        numpy_scores, numpy_codes = _score_numpy(*kernel_args)
+        kernel_scores, kernel_codes = score_kernel(*kernel_args)
+        self.assertEqual(list(numpy_codes), [0, 0, 1, 1, 2, 0])
+        self.assertEqual(list(kernel_codes), list(numpy_codes))
+        np.testing.assert_array_equal(kernel_scores, numpy_scores)
+
 if __name__ == "__main__":
     unittest.main()
 